@@ -4,24 +4,360 @@
 # Import required libraries
 import os
 import re
+import sys
 import json
-import pandas as pd
+import mmap
+import heapq
+import pickle
+import hashlib
+import functools
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
+from collections import Counter, OrderedDict
+from operator import itemgetter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 import warnings
-warnings.filterwarnings('ignore')
 
-# Set plotting style
-plt.style.use('default')
-sns.set_palette("husl")
-plt.rcParams['figure.figsize'] = (12, 8)
+# Optional linear-time regex engine (pip install google-re2). RE2 compiles each
+# pattern to a DFA with O(N) worst case, which keeps the unbounded .*? block
+# patterns from going super-linear on malformed dumps.
+try:
+    import re2 as _re2
+except ImportError:
+    _re2 = None
+
+
+def _compile_linear(pattern, flags=0):
+    """Compile via google-re2 when available, falling back to stdlib re"""
+    if _re2 is not None:
+        try:
+            return _re2.compile(pattern, flags)
+        except _re2.error:
+            pass
+    return re.compile(pattern, flags)
+
+# Optional columnar export: Parquet/Feather keep dtypes and read back with
+# near-zero parsing cost, unlike the CSV/JSON text formats
+try:
+    import pyarrow as _pa
+    from pyarrow import feather as _pa_feather
+except ImportError:
+    _pa = None
+
+# Optional C-implemented JSON encoder for the detailed export; stdlib json is
+# the fallback
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+# Optional streaming JSON parser for reading very large exports back in
+try:
+    import ijson as _ijson
+except ImportError:
+    _ijson = None
+
+# Exported JSON above this size is streamed instead of json.load-ed whole
+_STREAM_JSON_THRESHOLD = 50 * 1024 * 1024
+
+# Optional datashader rasterization: aggregates large timelines into a fixed
+# image in compiled code instead of drawing one matplotlib artist per point
+try:
+    import datashader as _ds
+    from datashader import transfer_functions as _ds_tf
+except ImportError:
+    _ds = None
+
+# Timelines with more points than this are rasterized when datashader is there
+_DATASHADER_THRESHOLD = 10_000
+
+# Plotting style is applied on first use; matplotlib/seaborn stay out of
+# module import so parse-and-export runs skip their cold-start cost
+_PLOTTING_CONFIGURED = False
+
+
+def _configure_plotting():
+    """Import matplotlib on first use and apply the shared plot style"""
+    global _PLOTTING_CONFIGURED
+    import matplotlib.pyplot as plt
+    if not _PLOTTING_CONFIGURED:
+        import seaborn as sns
+        plt.style.use('default')
+        sns.set_palette("husl")
+        plt.rcParams['figure.figsize'] = (12, 8)
+        _PLOTTING_CONFIGURED = True
+    return plt
+
+# Precompiled regex patterns (compiled once at import instead of per parse call).
+# The dumps are ASCII, so the patterns are bytes and run directly over the raw
+# file contents; only captured groups get decoded to str.
+_RE_OPLUS_BLOCK = _compile_linear(rb'Current OPLUS Battery Service state:(.*?)Current Battery Service state:', re.DOTALL)
+_RE_STD_BLOCK = _compile_linear(rb'Current Battery Service state:(.*?)(?:\n\n|\Z)', re.DOTALL)
+_RE_KV = re.compile(rb'^\s*([^:\n]+?)\s*:\s*(.*?)\s*$', re.MULTILINE)
+_RE_MODEL = re.compile(rb'^Model: ([^\n]+)', re.MULTILINE)
+_RE_BRAND = re.compile(rb'^Brand: ([^\n]+)', re.MULTILINE)
+_RE_ANDROID_VERSION = re.compile(rb'^Android Version: ([^\n]+)', re.MULTILINE)
+_RE_BUILD_PROP = _compile_linear(rb'\[(.+?)\]: \[(.+?)\]')
+_RE_THERMAL = _compile_linear(rb'Temperature\{mValue=([\d.]+), mType=(\d+), mName=([^,]+)|Thermal Status: (\d+)')
+_RE_POWER_STATE = re.compile(rb'^Power state: ([^\n]+)', re.MULTILINE)
+_RE_WAKE_LOCKS = re.compile(rb'^\s*Wake Locks: size=(\d+)', re.MULTILINE)
+_RE_CPU_LOAD = re.compile(rb'^Total: (\d+)%', re.MULTILINE)
+_RE_CPU_FREQ = re.compile(rb'^CPU(\d+): (\d+)MHz', re.MULTILINE)
+_RE_PROC_HEADER = re.compile(rb'^\s*\* (\S+) / (\S+) / ([^:\n]+):', re.MULTILINE)
+_RE_PROC_STATS = re.compile(rb'(TOTAL|Persistent|Bnd Fgs|Service): (\d+)%(?: \(([^)]+)\))?')
+_RE_TOTAL_MEMORY = re.compile(rb'TOTAL: \d+% \(([^)]+)\)')
+_RE_TOTAL_RAM = re.compile(rb'^\s*Total RAM: ([\d,]+)\s*K', re.MULTILINE)
+_RE_FREE_RAM = re.compile(rb'^\s*Free RAM: ([\d,]+)\s*K', re.MULTILINE)
+_RE_LINE = re.compile(rb'[^\n]+')
+_RE_PACKAGE = re.compile(rb'^\s*Package (\S+)', re.MULTILINE)
+_RE_FOREGROUND_TIME = re.compile(rb'^\s*Total time in foreground: ([^\n]+)', re.MULTILINE)
+_RE_VISIBLE_TIME = re.compile(rb'^\s*Total time visible: ([^\n]+)', re.MULTILINE)
+_RE_BACKGROUND_TIME = re.compile(rb'^\s*Total time in background: ([^\n]+)', re.MULTILINE)
+_RE_STATS_SINCE = re.compile(rb'^Statistics since ([^:\n]+):', re.MULTILINE)
+_RE_APP_HEADER = re.compile(rb'^  (\S+):\s*$', re.MULTILINE)
+_RE_APP_STATS = re.compile(rb'^    (Screen|CPU|Wake lock|Mobile network|Wifi): (\d+) ms', re.MULTILINE)
+
+# Optional Numba JIT for the procstats hot loop; the pure-regex path below is
+# used when numba is not installed
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(cache=True)
+    def _scan_stat_percents(arr):
+        """Scan a uint8 view of a procstats block for '<keyword>: <digits>%'
+        entries, returning parallel lists of keyword ids (0=TOTAL,
+        1=Persistent, 2=Bnd Fgs, 3=Service) and integer percentages"""
+        kinds = [0 for _ in range(0)]
+        values = [0 for _ in range(0)]
+        n = arr.size
+        i = 0
+        while i < n:
+            c = arr[i]
+            kind = -1
+            j = i
+            if c == 84 and i + 6 <= n:  # 'TOTAL:'
+                if arr[i + 1] == 79 and arr[i + 2] == 84 and arr[i + 3] == 65 and \
+                        arr[i + 4] == 76 and arr[i + 5] == 58:
+                    kind = 0
+                    j = i + 6
+            elif c == 80 and i + 11 <= n:  # 'Persistent:'
+                if arr[i + 1] == 101 and arr[i + 2] == 114 and arr[i + 3] == 115 and \
+                        arr[i + 4] == 105 and arr[i + 5] == 115 and arr[i + 6] == 116 and \
+                        arr[i + 7] == 101 and arr[i + 8] == 110 and arr[i + 9] == 116 and \
+                        arr[i + 10] == 58:
+                    kind = 1
+                    j = i + 11
+            elif c == 66 and i + 8 <= n:  # 'Bnd Fgs:'
+                if arr[i + 1] == 110 and arr[i + 2] == 100 and arr[i + 3] == 32 and \
+                        arr[i + 4] == 70 and arr[i + 5] == 103 and arr[i + 6] == 115 and \
+                        arr[i + 7] == 58:
+                    kind = 2
+                    j = i + 8
+            elif c == 83 and i + 8 <= n:  # 'Service:'
+                if arr[i + 1] == 101 and arr[i + 2] == 114 and arr[i + 3] == 118 and \
+                        arr[i + 4] == 105 and arr[i + 5] == 99 and arr[i + 6] == 101 and \
+                        arr[i + 7] == 58:
+                    kind = 3
+                    j = i + 8
+
+            if kind >= 0:
+                while j < n and arr[j] == 32:  # spaces
+                    j += 1
+                value = 0
+                digits = 0
+                while j < n and 48 <= arr[j] <= 57:
+                    value = value * 10 + (arr[j] - 48)
+                    j += 1
+                    digits += 1
+                if digits > 0 and j < n and arr[j] == 37:  # '%'
+                    kinds.append(kind)
+                    values.append(value)
+                i = j
+            else:
+                i += 1
+
+        return kinds, values
+    @njit(cache=True)
+    def _classify_process_types(persistent, service, bound_fg):
+        """Classify each process into 0=Persistent, 1=Service, 2=Bound FG,
+        3=Other based on which stat dominates"""
+        out = np.empty(persistent.size, np.int8)
+        for i in range(persistent.size):
+            if persistent[i] > 50:
+                out[i] = 0
+            elif service[i] > 50:
+                out[i] = 1
+            elif bound_fg[i] > 50:
+                out[i] = 2
+            else:
+                out[i] = 3
+        return out
+else:
+    _scan_stat_percents = None
+    _classify_process_types = None
+
+# Stat keys indexed by the scanner's keyword ids
+_PROC_STAT_ID_KEYS = ('total_percent', 'persistent_percent', 'bound_foreground_percent', 'service_percent')
+
+# Map combined-pattern keywords to the stat keys used in parsed data
+_PROC_STAT_KEYS = {
+    b'TOTAL': 'total_percent',
+    b'Persistent': 'persistent_percent',
+    b'Bnd Fgs': 'bound_foreground_percent',
+    b'Service': 'service_percent'
+}
+_APP_STAT_KEYS = {
+    b'Screen': 'screen_time_ms',
+    b'CPU': 'cpu_time_ms',
+    b'Wake lock': 'wake_lock_ms',
+    b'Mobile network': 'mobile_network_ms',
+    b'Wifi': 'wifi_time_ms'
+}
+
+# Month abbreviations used in session directory names
+_MONTHS = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
+}
+
+# Memoized timestamps; sessions are re-discovered across runs
+_TS_CACHE = {}
+
+
+# Files above this size are memory-mapped rather than read onto the heap
+_MMAP_THRESHOLD = 64 * 1024
+
+
+def _read_bytes(file_path):
+    """Read a log file as raw bytes (the dumps are ASCII, so skipping the
+    UTF-8 decode avoids allocating a second full-size str per file).
+
+    Multi-MB dumps are memory-mapped instead of copied: the OS pages them
+    in on demand and the bytes patterns search the mapping directly, so
+    peak memory stays at the handful of captured groups."""
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD:
+            try:
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                pass
+        return f.read()
+
+
+# In-memory memo of parsed results keyed by content hash: successive sessions
+# often re-emit byte-identical dumps (device_info, memory_info), so identical
+# content is parsed only once per run. Bounded LRU keeps memory flat.
+_CONTENT_CACHE = OrderedDict()
+_CONTENT_CACHE_MAX = 1024
+
+
+def _memoize_content(parse_fn):
+    """Wrap a parse method so byte-identical file contents are parsed once"""
+    @functools.wraps(parse_fn)
+    def wrapper(self, file_path):
+        try:
+            content = _read_bytes(file_path)
+        except OSError as e:
+            print(f"Error parsing {file_path}: {e}")
+            return {}
+
+        key = (parse_fn.__name__, hashlib.blake2b(content, digest_size=16).digest())
+        cached = _CONTENT_CACHE.get(key)
+        if cached is not None:
+            _CONTENT_CACHE.move_to_end(key)
+            return cached
+
+        result = parse_fn(self, file_path, content)
+        _CONTENT_CACHE[key] = result
+        if len(_CONTENT_CACHE) > _CONTENT_CACHE_MAX:
+            _CONTENT_CACHE.popitem(last=False)
+        return result
+    return wrapper
+
+
+def _coerce(key, value):
+    """Convert a raw key/value string to int, float (temperatures) or bool"""
+    try:
+        value = int(value)
+    except ValueError:
+        value_lower = value.lower()
+        if value_lower == 'true':
+            return True
+        if value_lower == 'false':
+            return False
+        return value
+
+    # Fix temperature scaling (likely in tenths of a degree)
+    if 'temp' in key.lower():
+        value = value / 10.0
+    return value
+
+
+def _fill(column, i, value):
+    """Write a parsed value into a numeric summary column, skipping values
+    that are missing or not numeric"""
+    if value is not None:
+        try:
+            column[i] = value
+        except (TypeError, ValueError):
+            pass
+
+
+def _session_signature(session_info):
+    """Stat-based fingerprint of a session's files. The dumps are immutable
+    historical snapshots, so (name, mtime, size) is enough to detect change"""
+    signature = []
+    for file_path in sorted(session_info['files']):
+        try:
+            st = file_path.stat()
+            signature.append((file_path.name, st.st_mtime_ns, st.st_size))
+        except OSError:
+            signature.append((file_path.name, None, None))
+    return tuple(signature)
+
+
+def _parse_session(item):
+    """Parse one session's files; module-level so worker processes can run it"""
+    session_name, session_info = item
+    parser = PhoneDiagnosticParser()
+
+    session_data = {
+        'timestamp': session_info['timestamp'],
+        'files_parsed': []
+    }
+
+    for file_path in session_info['files']:
+        filename = file_path.name
+        entry = PhoneDiagnosticParser._PARSERS.get(filename)
+        if entry:
+            key, method = entry
+            session_data[key] = getattr(parser, method)(file_path)
+            session_data['files_parsed'].append(filename)
+
+    return session_name, session_data
+
 
 class PhoneDiagnosticParser:
     """Parser for phone diagnostic data collected via ADB commands"""
-    
+
+    # Dispatch table mapping diagnostic filenames to (session_data key,
+    # parser method name); new parsers only need an entry here
+    _PARSERS = {
+        'battery_basic.txt': ('battery_basic', 'parse_battery_basic'),
+        'device_info.txt': ('device_info', 'parse_device_info'),
+        'thermal.txt': ('thermal', 'parse_thermal'),
+        'power.txt': ('power', 'parse_power'),
+        'cpuinfo.txt': ('cpuinfo', 'parse_cpuinfo'),
+        'procstats.txt': ('procstats', 'parse_procstats'),
+        'memory_info.txt': ('memory_info', 'parse_memory_info'),
+        'usage_stats.txt': ('usage_stats', 'parse_usage_stats'),
+        'battery_stats_detailed.txt': ('battery_stats_detailed', 'parse_battery_stats_detailed')
+    }
+
     def __init__(self, logs_dir="logs"):
         self.logs_dir = Path(logs_dir)
         self.sessions = {}
@@ -49,250 +385,217 @@ class PhoneDiagnosticParser:
     
     def _parse_timestamp(self, dirname):
         """Parse timestamp from a directory name like '23-Aug-25_03-20-07-44'."""
+        if dirname in _TS_CACHE:
+            return _TS_CACHE[dirname]
+
         try:
-            # Define the format string that matches "DD-Mon-YY_HH-MM-SS"
-            format_string = '%d-%b-%y_%H-%M-%S'
-            
-            # Parse the directory name, slicing off the fractional seconds ('-44') at the end.
-            return datetime.strptime(dirname[:-3], format_string)
-            
-        except ValueError as e:
-            # If the directory name doesn't match the format, a ValueError is raised.
-            # We'll print a warning and return None.
+            # The names are fixed-width "DD-Mon-YY_HH-MM-SS" (plus fractional
+            # seconds we ignore), so slice the fields directly instead of going
+            # through the much slower locale-aware datetime.strptime
+            timestamp = datetime(
+                2000 + int(dirname[7:9]),    # year
+                _MONTHS[dirname[3:6]],       # month
+                int(dirname[0:2]),           # day
+                int(dirname[10:12]),         # hour
+                int(dirname[13:15]),         # minute
+                int(dirname[16:18])          # second
+            )
+        except (ValueError, KeyError) as e:
+            # If the directory name doesn't match the format,
+            # print a warning and record None.
             print(f"Warning: Could not parse timestamp from '{dirname}': {e}")
-            return None
+            timestamp = None
+
+        _TS_CACHE[dirname] = timestamp
+        return timestamp
     
-    def parse_battery_basic(self, file_path):
+    @_memoize_content
+    def parse_battery_basic(self, file_path, content):
         """Parse basic battery information"""
         data = {}
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
             # Parse OPLUS Battery Service state
-            oplus_match = re.search(r'Current OPLUS Battery Service state:(.*?)Current Battery Service state:', 
-                                   content, re.DOTALL)
+            oplus_match = _RE_OPLUS_BLOCK.search(content)
             if oplus_match:
-                oplus_section = oplus_match.group(1)
-                
-                # Extract key-value pairs
-                for line in oplus_section.split('\n'):
-                    if ':' in line:
-                        key, value = line.split(':', 1)
-                        key = key.strip()
-                        value = value.strip()
-                        
-                        # Convert values to appropriate types
-                        if value.isdigit():
-                            value = int(value)
-                            # Fix temperature scaling (likely in tenths of a degree)
-                            if key.lower() in ['temp', 'temperature', 'phonetemp'] or 'temp' in key.lower():
-                                value = value / 10.0
-                        elif value.lower() in ['true', 'false']:
-                            value = value.lower() == 'true'
-                        
-                        data[f'oplus_{key}'] = value
-            
+                # Extract key-value pairs in a single multiline pass over the block
+                for kv in _RE_KV.finditer(oplus_match.group(1)):
+                    key = kv.group(1).decode('utf-8', 'replace')
+                    data[f'oplus_{key}'] = _coerce(key, kv.group(2).decode('utf-8', 'replace'))
+
             # Parse standard Battery Service state
-            std_match = re.search(r'Current Battery Service state:(.*?)(?=\n\n|$)', 
-                                 content, re.DOTALL)
+            std_match = _RE_STD_BLOCK.search(content)
             if std_match:
-                std_section = std_match.group(1)
-                
-                for line in std_section.split('\n'):
-                    if ':' in line:
-                        key, value = line.split(':', 1)
-                        key = key.strip()
-                        value = value.strip()
-                        
-                        # Convert values to appropriate types
-                        if value.isdigit():
-                            value = int(value)
-                            # Fix temperature scaling (likely in tenths of a degree)
-                            if key.lower() in ['temp', 'temperature'] or 'temp' in key.lower():
-                                value = value / 10.0
-                        elif value.lower() in ['true', 'false']:
-                            value = value.lower() == 'true'
-                        
-                        data[f'std_{key}'] = value
+                for kv in _RE_KV.finditer(std_match.group(1)):
+                    key = kv.group(1).decode('utf-8', 'replace')
+                    data[f'std_{key}'] = _coerce(key, kv.group(2).decode('utf-8', 'replace'))
                         
         except Exception as e:
             print(f"Error parsing {file_path}: {e}")
             
         return data
     
-    def parse_device_info(self, file_path):
+    @_memoize_content
+    def parse_device_info(self, file_path, content):
         """Parse device information"""
         data = {}
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
             # Extract basic device info
-            model_match = re.search(r'Model: (.+)', content)
+            model_match = _RE_MODEL.search(content)
             if model_match:
-                data['model'] = model_match.group(1).strip()
+                data['model'] = model_match.group(1).strip().decode('utf-8', 'replace')
                 
-            brand_match = re.search(r'Brand: (.+)', content)
+            brand_match = _RE_BRAND.search(content)
             if brand_match:
-                data['brand'] = brand_match.group(1).strip()
+                data['brand'] = brand_match.group(1).strip().decode('utf-8', 'replace')
                 
-            android_match = re.search(r'Android Version: (.+)', content)
+            android_match = _RE_ANDROID_VERSION.search(content)
             if android_match:
-                data['android_version'] = android_match.group(1).strip()
+                data['android_version'] = android_match.group(1).strip().decode('utf-8', 'replace')
                 
-            # Extract build properties
-            build_props = re.findall(r'\[(.+?)\]: \[(.+?)\]', content)
-            for prop, value in build_props:
-                data[f'prop_{prop}'] = value
+            # Extract build properties, streaming matches instead of
+            # materializing a findall list of tuples. Property names repeat
+            # across sessions, so intern them to share one str object.
+            for prop_match in _RE_BUILD_PROP.finditer(content):
+                prop = sys.intern(f"prop_{prop_match.group(1).decode('utf-8', 'replace')}")
+                data[prop] = prop_match.group(2).decode('utf-8', 'replace')
                 
         except Exception as e:
             print(f"Error parsing {file_path}: {e}")
             
         return data
     
-    def parse_thermal(self, file_path):
+    @_memoize_content
+    def parse_thermal(self, file_path, content):
         """Parse thermal information"""
         data = {}
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-            # Extract temperature readings
-            temp_matches = re.findall(r'Temperature\{mValue=([\d.]+), mType=(\d+), mName=([^,]+)', content)
-            
+            # Extract temperature readings and thermal status in one pass
+            # over the content via a combined alternation pattern
+            names = []
+            types = []
+            values = []
+            thermal_status = None
+
+            for m in _RE_THERMAL.finditer(content):
+                if m.group(1) is not None:
+                    values.append(float(m.group(1)))
+                    types.append(int(m.group(2)))
+                    names.append(m.group(3).decode('utf-8', 'replace'))
+                elif m.group(4) is not None:
+                    thermal_status = int(m.group(4))
+
+            # Fix temperature scaling in one vectorized pass (values over 100
+            # are likely reported in tenths of a degree)
             temperatures = {}
-            for value, temp_type, name in temp_matches:
-                # Fix temperature scaling if needed (some devices report in tenths)
-                temp_value = float(value)
-                if temp_value > 100:  # Likely in tenths of a degree
-                    temp_value = temp_value / 10.0
-                
-                temperatures[name] = {
-                    'value': temp_value,
-                    'type': int(temp_type)
-                }
-            
+            if values:
+                scaled = np.asarray(values, dtype=np.float64)
+                scaled = np.where(scaled > 100, scaled / 10.0, scaled)
+                for name, temp_type, temp_value in zip(names, types, scaled):
+                    temperatures[name] = {
+                        'value': float(temp_value),
+                        'type': temp_type
+                    }
+
             data['temperatures'] = temperatures
-            
-            # Extract thermal status
-            status_match = re.search(r'Thermal Status: (\d+)', content)
-            if status_match:
-                data['thermal_status'] = int(status_match.group(1))
+
+            if thermal_status is not None:
+                data['thermal_status'] = thermal_status
                 
         except Exception as e:
             print(f"Error parsing {file_path}: {e}")
             
         return data
     
-    def parse_power(self, file_path):
+    @_memoize_content
+    def parse_power(self, file_path, content):
         """Parse power management information"""
         data = {}
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-            # Extract power state
-            state_match = re.search(r'Power state: (.+)', content)
-            if state_match:
-                data['power_state'] = state_match.group(1).strip()
-                
+            # Extract power state (substring prefilter avoids the regex scan
+            # when the section is absent; find() rather than 'in' because the
+            # content may be an mmap, which has no substring containment)
+            if content.find(b'Power state:') != -1:
+                state_match = _RE_POWER_STATE.search(content)
+                if state_match:
+                    data['power_state'] = state_match.group(1).strip().decode('utf-8', 'replace')
+
             # Extract wake locks
-            wake_locks = re.findall(r'Wake Locks: size=(\d+)', content)
-            if wake_locks:
-                data['wake_locks_count'] = int(wake_locks[0])
+            if content.find(b'Wake Locks:') != -1:
+                wake_locks = _RE_WAKE_LOCKS.findall(content)
+                if wake_locks:
+                    data['wake_locks_count'] = int(wake_locks[0])
                 
         except Exception as e:
             print(f"Error parsing {file_path}: {e}")
             
         return data
     
-    def parse_cpuinfo(self, file_path):
+    @_memoize_content
+    def parse_cpuinfo(self, file_path, content):
         """Parse CPU information"""
         data = {}
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
             # Extract CPU load
-            load_match = re.search(r'Total: (\d+)%', content)
+            load_match = _RE_CPU_LOAD.search(content)
             if load_match:
                 data['cpu_load_total'] = int(load_match.group(1))
                 
             # Extract CPU frequencies
-            freq_matches = re.findall(r'CPU(\d+): (\d+)MHz', content)
+            freq_matches = _RE_CPU_FREQ.findall(content)
             if freq_matches:
-                data['cpu_frequencies'] = {f'CPU{num}': int(freq) for num, freq in freq_matches}
+                data['cpu_frequencies'] = {f'CPU{int(num)}': int(freq) for num, freq in freq_matches}
                 
         except Exception as e:
             print(f"Error parsing {file_path}: {e}")
             
         return data
     
-    def parse_procstats(self, file_path):
+    @_memoize_content
+    def parse_procstats(self, file_path, content):
         """Parse process statistics information"""
         data = {}
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-            # Extract process information
+            # Extract process information: find all process headers in one pass,
+            # then scan the slice between consecutive headers for stats lines
             processes = []
-            current_process = {}
-            
-            for line in content.split('\n'):
-                line = line.strip()
-                if line.startswith('*') and ' / ' in line:
-                    # New process entry
-                    if current_process:
-                        processes.append(current_process)
-                    
-                    # Parse process line: * package.name / user / version:
-                    parts = line.split(' / ')
-                    if len(parts) >= 3:
-                        package_name = parts[0].replace('* ', '').strip()
-                        user = parts[1].strip()
-                        version = parts[2].replace(':', '').strip()
-                        
-                        current_process = {
-                            'package_name': package_name,
-                            'user': user,
-                            'version': version,
-                            'stats': {}
-                        }
-                elif ':' in line and current_process:
-                    # Parse statistics line
-                    if 'TOTAL:' in line:
-                        # Extract memory usage: TOTAL: 100% (12MB-12MB-12MB/1.1MB-2.1MB-3.1MB/41MB-41MB-42MB over 5)
-                        total_match = re.search(r'TOTAL: (\d+)% \(([^)]+)\)', line)
-                        if total_match:
-                            current_process['stats']['total_percent'] = int(total_match.group(1))
-                            current_process['stats']['total_memory'] = total_match.group(2)
-                    
-                    elif 'Persistent:' in line:
-                        persistent_match = re.search(r'Persistent: (\d+)%', line)
-                        if persistent_match:
-                            current_process['stats']['persistent_percent'] = int(persistent_match.group(1))
-                    
-                    elif 'Bnd Fgs:' in line:
-                        bnd_fgs_match = re.search(r'Bnd Fgs: (\d+)%', line)
-                        if bnd_fgs_match:
-                            current_process['stats']['bound_foreground_percent'] = int(bnd_fgs_match.group(1))
-                    
-                    elif 'Service:' in line:
-                        service_match = re.search(r'Service: (\d+)%', line)
-                        if service_match:
-                            current_process['stats']['service_percent'] = int(service_match.group(1))
-            
-            # Add the last process
-            if current_process:
-                processes.append(current_process)
+            headers = list(_RE_PROC_HEADER.finditer(content))
+
+            for i, header in enumerate(headers):
+                block_end = headers[i + 1].start() if i + 1 < len(headers) else len(content)
+                block = content[header.end():block_end]
+
+                stats = {}
+                if _scan_stat_percents is not None:
+                    # JIT-compiled scan over a uint8 view of the block; only the
+                    # TOTAL memory detail still needs a (single) regex search
+                    kinds, values = _scan_stat_percents(np.frombuffer(block, dtype=np.uint8))
+                    for kind, value in zip(kinds, values):
+                        stats[_PROC_STAT_ID_KEYS[kind]] = value
+                    if 'total_percent' in stats:
+                        memory_match = _RE_TOTAL_MEMORY.search(block)
+                        if memory_match:
+                            # Memory usage: TOTAL: 100% (12MB-12MB-12MB/1.1MB-2.1MB-3.1MB/41MB-41MB-42MB over 5)
+                            stats['total_memory'] = memory_match.group(1).decode('utf-8', 'replace')
+                else:
+                    for stat_match in _RE_PROC_STATS.finditer(block):
+                        keyword = stat_match.group(1)
+                        stats[_PROC_STAT_KEYS[keyword]] = int(stat_match.group(2))
+                        if keyword == b'TOTAL' and stat_match.group(3):
+                            # Memory usage: TOTAL: 100% (12MB-12MB-12MB/1.1MB-2.1MB-3.1MB/41MB-41MB-42MB over 5)
+                            stats['total_memory'] = stat_match.group(3).decode('utf-8', 'replace')
+
+                processes.append({
+                    'package_name': header.group(1).decode('utf-8', 'replace'),
+                    'user': header.group(2).decode('utf-8', 'replace'),
+                    'version': header.group(3).decode('utf-8', 'replace'),
+                    'stats': stats
+                })
             
             data['processes'] = processes
             data['total_processes'] = len(processes)
@@ -302,28 +605,26 @@ class PhoneDiagnosticParser:
             
         return data
     
-    def parse_memory_info(self, file_path):
+    @_memoize_content
+    def parse_memory_info(self, file_path, content):
         """Parse memory information"""
         data = {}
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
             # CORRECTED: Regex now handles commas `[\d,]+` and the unit `K`
-            total_match = re.search(r'Total RAM: ([\d,]+)\s*K', content)
+            total_match = _RE_TOTAL_RAM.search(content)
             if total_match:
                 # CORRECTED: Must remove commas before converting to an integer
-                total_ram_str = total_match.group(1).replace(',', '')
+                total_ram_str = total_match.group(1).replace(b',', b'')
                 data['total_ram_kb'] = int(total_ram_str)
                 data['total_ram_mb'] = data['total_ram_kb'] / 1024
                 data['total_ram_gb'] = data['total_ram_mb'] / 1024
             
             # CORRECTED: Apply the same fix for Free RAM
-            free_match = re.search(r'Free RAM: ([\d,]+)\s*K', content)
+            free_match = _RE_FREE_RAM.search(content)
             if free_match:
                 # CORRECTED: Must remove commas before converting to an integer
-                free_ram_str = free_match.group(1).replace(',', '')
+                free_ram_str = free_match.group(1).replace(b',', b'')
                 data['free_ram_kb'] = int(free_ram_str)
                 data['free_ram_mb'] = data['free_ram_kb'] / 1024
                 
@@ -344,47 +645,52 @@ class PhoneDiagnosticParser:
             
         return data
     
-    def parse_usage_stats(self, file_path):
+    @_memoize_content
+    def parse_usage_stats(self, file_path, content):
         """Parse usage statistics"""
         data = {}
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
             # Extract app usage statistics
             app_stats = []
             current_app = {}
             
-            for line in content.split('\n'):
-                line = line.strip()
-                if line.startswith('Package ') and ':' in line:
-                    # New app entry
-                    if current_app:
-                        app_stats.append(current_app)
-                    
-                    package_match = re.search(r'Package (\S+)', line)
+            # Iterate lines via finditer rather than split(b'\n'), which would
+            # materialize a list object per line for the whole file up front
+            # Raw lines are used as-is: the substring tests and patterns below
+            # tolerate the leading indentation, so there is no need to allocate
+            # a stripped copy of every line
+            for line_match in _RE_LINE.finditer(content):
+                line = line_match.group(0)
+                if b'Package ' in line and b':' in line:
+                    # New app entry; commit the previous one only once the
+                    # anchored pattern confirms a real package header, so
+                    # lines that merely contain 'Package ' can't duplicate it
+                    package_match = _RE_PACKAGE.search(line)
                     if package_match:
+                        if current_app:
+                            app_stats.append(current_app)
                         current_app = {
-                            'package_name': package_match.group(1),
+                            'package_name': package_match.group(1).decode('utf-8', 'replace'),
                             'stats': {}
                         }
-                elif ':' in line and current_app:
-                    # Parse usage statistics
-                    if 'Total time in foreground:' in line:
-                        time_match = re.search(r'Total time in foreground: (.+)', line)
+                elif b'Total time' in line and current_app:
+                    # Parse usage statistics; the cheap substring test above skips
+                    # the regex machinery entirely for non-matching lines
+                    if b'Total time in foreground:' in line:
+                        time_match = _RE_FOREGROUND_TIME.search(line)
                         if time_match:
-                            current_app['stats']['foreground_time'] = time_match.group(1)
-                    
-                    elif 'Total time visible:' in line:
-                        time_match = re.search(r'Total time visible: (.+)', line)
+                            current_app['stats']['foreground_time'] = time_match.group(1).decode('utf-8', 'replace')
+
+                    elif b'Total time visible:' in line:
+                        time_match = _RE_VISIBLE_TIME.search(line)
                         if time_match:
-                            current_app['stats']['visible_time'] = time_match.group(1)
-                    
-                    elif 'Total time in background:' in line:
-                        time_match = re.search(r'Total time in background: (.+)', line)
+                            current_app['stats']['visible_time'] = time_match.group(1).decode('utf-8', 'replace')
+
+                    elif b'Total time in background:' in line:
+                        time_match = _RE_BACKGROUND_TIME.search(line)
                         if time_match:
-                            current_app['stats']['background_time'] = time_match.group(1)
+                            current_app['stats']['background_time'] = time_match.group(1).decode('utf-8', 'replace')
             
             # Add the last app
             if current_app:
@@ -398,134 +704,150 @@ class PhoneDiagnosticParser:
             
         return data
     
-    def parse_battery_stats_detailed(self, file_path):
+    @_memoize_content
+    def parse_battery_stats_detailed(self, file_path, content):
         """Parse detailed battery statistics"""
         data = {}
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-            # Extract battery usage by app
+            # Extract time period
+            time_match = _RE_STATS_SINCE.search(content)
+            if time_match:
+                data['period'] = time_match.group(1).decode('utf-8', 'replace')
+
+            # Extract battery usage by app: find all app headers ("  com.example.app:")
+            # in one pass, then scan the slice between consecutive headers for stats
             app_battery = []
-            current_app = {}
-            
-            for line in content.split('\n'):
-                line = line.strip()
-                if line.startswith('Statistics since last charge:') or line.startswith('Statistics since last unplugged:'):
-                    # Extract time period
-                    time_match = re.search(r'Statistics since (.+):', line)
-                    if time_match:
-                        data['period'] = time_match.group(1)
-                
-                elif line.startswith('  ') and ':' in line and not line.startswith('    '):
-                    # App entry line
-                    if current_app:
-                        app_battery.append(current_app)
-                    
-                    # Parse app line: "  com.example.app:"
-                    app_match = re.search(r'^\s+(\S+):', line)
-                    if app_match:
-                        current_app = {
-                            'package_name': app_match.group(1),
-                            'stats': {}
-                        }
-                
-                elif line.startswith('    ') and current_app:
-                    # Parse app statistics
-                    if 'Screen' in line and 'ms' in line:
-                        screen_match = re.search(r'Screen: (\d+) ms', line)
-                        if screen_match:
-                            current_app['stats']['screen_time_ms'] = int(screen_match.group(1))
-                    
-                    elif 'CPU' in line and 'ms' in line:
-                        cpu_match = re.search(r'CPU: (\d+) ms', line)
-                        if cpu_match:
-                            current_app['stats']['cpu_time_ms'] = int(cpu_match.group(1))
-                    
-                    elif 'Wake lock' in line and 'ms' in line:
-                        wake_match = re.search(r'Wake lock: (\d+) ms', line)
-                        if wake_match:
-                            current_app['stats']['wake_lock_ms'] = int(wake_match.group(1))
-                    
-                    elif 'Mobile network' in line and 'ms' in line:
-                        mobile_match = re.search(r'Mobile network: (\d+) ms', line)
-                        if mobile_match:
-                            current_app['stats']['mobile_network_ms'] = int(mobile_match.group(1))
-                    
-                    elif 'Wifi' in line and 'ms' in line:
-                        wifi_match = re.search(r'Wifi: (\d+) ms', line)
-                        if wifi_match:
-                            current_app['stats']['wifi_time_ms'] = int(wifi_match.group(1))
-            
-            # Add the last app
-            if current_app:
-                app_battery.append(current_app)
-            
+            screen_ms = []
+            cpu_ms = []
+            wake_ms = []
+            headers = list(_RE_APP_HEADER.finditer(content))
+
+            for i, header in enumerate(headers):
+                block_end = headers[i + 1].start() if i + 1 < len(headers) else len(content)
+                block = content[header.end():block_end]
+
+                stats = {}
+                for stat_match in _RE_APP_STATS.finditer(block):
+                    stats[_APP_STAT_KEYS[stat_match.group(1)]] = int(stat_match.group(2))
+
+                app_battery.append({
+                    'package_name': header.group(1).decode('utf-8', 'replace'),
+                    'stats': stats
+                })
+
+                # Parallel structure-of-arrays columns (0 where a stat is absent)
+                # so the totals below are single vectorized reductions
+                screen_ms.append(stats.get('screen_time_ms', 0))
+                cpu_ms.append(stats.get('cpu_time_ms', 0))
+                wake_ms.append(stats.get('wake_lock_ms', 0))
+
             data['app_battery'] = app_battery
             data['total_apps'] = len(app_battery)
-            
+
             # Calculate total battery impact
-            total_screen = sum(app.get('stats', {}).get('screen_time_ms', 0) for app in app_battery)
-            total_cpu = sum(app.get('stats', {}).get('cpu_time_ms', 0) for app in app_battery)
-            total_wake = sum(app.get('stats', {}).get('wake_lock_ms', 0) for app in app_battery)
-            
-            data['total_screen_time_ms'] = total_screen
-            data['total_cpu_time_ms'] = total_cpu
-            data['total_wake_lock_ms'] = total_wake
+            data['total_screen_time_ms'] = int(np.asarray(screen_ms, dtype=np.int64).sum())
+            data['total_cpu_time_ms'] = int(np.asarray(cpu_ms, dtype=np.int64).sum())
+            data['total_wake_lock_ms'] = int(np.asarray(wake_ms, dtype=np.int64).sum())
             
         except Exception as e:
             print(f"Error parsing {file_path}: {e}")
             
         return data
     
+    def _load_parse_cache(self):
+        """Load the on-disk parse cache, returning an empty dict on any failure"""
+        try:
+            with open(self.logs_dir / '.parse_cache.pkl', 'rb') as f:
+                return pickle.load(f)
+        except (OSError, pickle.PickleError, EOFError):
+            return {}
+
+    def _save_parse_cache(self, cache):
+        """Persist the parse cache next to the logs directory"""
+        try:
+            with open(self.logs_dir / '.parse_cache.pkl', 'wb') as f:
+                pickle.dump(cache, f, protocol=5)
+        except OSError as e:
+            print(f"Warning: could not write parse cache: {e}")
+
+    def _summary_cache_path(self):
+        """Sidecar path for the cached summary table.
+
+        The name embeds a digest of every discovered session file's stat
+        signature, so any change on disk produces a different path and the
+        stale cache is simply never hit."""
+        h = hashlib.blake2b(digest_size=16)
+        for session_name in sorted(self.sessions):
+            h.update(session_name.encode())
+            h.update(repr(_session_signature(self.sessions[session_name])).encode())
+        suffix = '.feather' if _pa is not None else '.pkl'
+        return self.logs_dir / f".summary_cache_{h.hexdigest()}{suffix}"
+
+    def load_cached_summary(self):
+        """Return the cached summary DataFrame, or None when any file changed"""
+        path = self._summary_cache_path()
+        try:
+            if _pa is not None:
+                return _pa_feather.read_table(path).to_pandas()
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except (OSError, ValueError, pickle.PickleError, EOFError):
+            # A truncated or corrupt sidecar (e.g. an interrupted write) must
+            # fall through to a rebuild; pyarrow's ArrowInvalid is a
+            # ValueError and its ArrowIOError an OSError
+            return None
+
+    def save_cached_summary(self, summary_df):
+        """Persist the summary DataFrame next to the logs for cheap reruns"""
+        path = self._summary_cache_path()
+        try:
+            for stale in self.logs_dir.glob('.summary_cache_*'):
+                if stale != path:
+                    stale.unlink()
+            if _pa is not None:
+                _pa_feather.write_feather(_pa.Table.from_pandas(summary_df),
+                                          path, compression='zstd')
+            else:
+                with open(path, 'wb') as f:
+                    pickle.dump(summary_df, f, protocol=5)
+        except OSError as e:
+            print(f"Warning: could not write summary cache: {e}")
+
     def parse_all_sessions(self):
-        """Parse all diagnostic sessions"""
+        """Parse all diagnostic sessions, fanning out across CPU cores"""
         if not self.sessions:
             self.discover_sessions()
-            
+
+        # Sessions are immutable once collected, so re-parsing on every run is
+        # wasted work: reuse cached results for any session whose file
+        # signatures are unchanged and only dispatch the rest to the pool
+        cache = self._load_parse_cache()
+        signatures = {name: _session_signature(info) for name, info in self.sessions.items()}
+        pending = {}
+
         for session_name, session_info in self.sessions.items():
-            print(f"Parsing session: {session_name}")
-            
-            session_data = {
-                'timestamp': session_info['timestamp'],
-                'files_parsed': []
-            }
-            
-            for file_path in session_info['files']:
-                filename = file_path.name
-                
-                if filename == 'battery_basic.txt':
-                    session_data['battery_basic'] = self.parse_battery_basic(file_path)
-                    session_data['files_parsed'].append(filename)
-                elif filename == 'device_info.txt':
-                    session_data['device_info'] = self.parse_device_info(file_path)
-                    session_data['files_parsed'].append(filename)
-                elif filename == 'thermal.txt':
-                    session_data['thermal'] = self.parse_thermal(file_path)
-                    session_data['files_parsed'].append(filename)
-                elif filename == 'power.txt':
-                    session_data['power'] = self.parse_power(file_path)
-                    session_data['files_parsed'].append(filename)
-                elif filename == 'cpuinfo.txt':
-                    session_data['cpuinfo'] = self.parse_cpuinfo(file_path)
-                    session_data['files_parsed'].append(filename)
-                elif filename == 'procstats.txt':
-                    session_data['procstats'] = self.parse_procstats(file_path)
-                    session_data['files_parsed'].append(filename)
-                elif filename == 'memory_info.txt':
-                    session_data['memory_info'] = self.parse_memory_info(file_path)
-                    session_data['files_parsed'].append(filename)
-                elif filename == 'usage_stats.txt':
-                    session_data['usage_stats'] = self.parse_usage_stats(file_path)
-                    session_data['files_parsed'].append(filename)
-                elif filename == 'battery_stats_detailed.txt':
-                    session_data['battery_stats_detailed'] = self.parse_battery_stats_detailed(file_path)
-                    session_data['files_parsed'].append(filename)
-                
-            self.parsed_data[session_name] = session_data
-            
-        print(f"Parsed {len(self.parsed_data)} sessions")
+            cached = cache.get(session_name)
+            if cached is not None and cached['signature'] == signatures[session_name]:
+                self.parsed_data[session_name] = cached['data']
+            else:
+                pending[session_name] = session_info
+
+        if pending:
+            # Parsing is regex/CPU-bound and sessions are independent, so a
+            # process pool scales near-linearly with physical cores
+            with ProcessPoolExecutor() as executor:
+                for session_name, session_data in executor.map(_parse_session, pending.items(), chunksize=4):
+                    print(f"Parsed session: {session_name}")
+                    self.parsed_data[session_name] = session_data
+                    cache[session_name] = {
+                        'signature': signatures[session_name],
+                        'data': session_data
+                    }
+
+            self._save_parse_cache(cache)
+
+        print(f"Parsed {len(self.parsed_data)} sessions ({len(self.sessions) - len(pending)} from cache)")
         return self.parsed_data
     
     def get_summary_dataframe(self):
@@ -533,360 +855,541 @@ class PhoneDiagnosticParser:
         if not self.parsed_data:
             self.parse_all_sessions()
             
-        summary_data = []
-        
-        for session_name, session_data in self.parsed_data.items():
-            row = {
-                'session': session_name,
-                'timestamp': session_data['timestamp'],
-                'files_parsed': len(session_data['files_parsed'])
-            }
-            
+        n = len(self.parsed_data)
+
+        # Pre-allocate one typed column array per field and fill by index so
+        # pandas adopts the arrays as-is instead of inferring dtypes from a
+        # list of per-session Python dicts
+        cols = {
+            'session': np.empty(n, dtype=object),
+            'timestamp': np.full(n, np.datetime64('NaT'), dtype='datetime64[ns]'),
+            'files_parsed': np.zeros(n, dtype=np.int64),
+            'battery_level': np.full(n, np.nan, dtype=np.float32),
+            'battery_voltage': np.full(n, np.nan, dtype=np.float32),
+            'battery_temperature': np.full(n, np.nan, dtype=np.float32),
+            'charging_status': np.full(n, np.nan, dtype=np.float32),
+            'ac_powered': np.empty(n, dtype=object),
+            'usb_powered': np.empty(n, dtype=object),
+            'phone_temp': np.full(n, np.nan, dtype=np.float32),
+            'model': np.empty(n, dtype=object),
+            'brand': np.empty(n, dtype=object),
+            'android_version': np.empty(n, dtype=object),
+            'cpu_temp': np.full(n, np.nan, dtype=np.float32),
+            'gpu_temp': np.full(n, np.nan, dtype=np.float32),
+            'battery_temp_thermal': np.full(n, np.nan, dtype=np.float32),
+            'skin_temp': np.full(n, np.nan, dtype=np.float32),
+            'total_processes': np.full(n, np.nan, dtype=np.float32),
+            'total_ram_gb': np.full(n, np.nan, dtype=np.float32),
+            'used_ram_mb': np.full(n, np.nan, dtype=np.float32),
+            'ram_usage_percent': np.full(n, np.nan, dtype=np.float32),
+            'total_screen_time_ms': np.full(n, np.nan, dtype=np.float64),
+            'total_cpu_time_ms': np.full(n, np.nan, dtype=np.float64),
+            'total_wake_lock_ms': np.full(n, np.nan, dtype=np.float64)
+        }
+
+        for i, (session_name, session_data) in enumerate(self.parsed_data.items()):
+            cols['session'][i] = session_name
+            if session_data['timestamp'] is not None:
+                cols['timestamp'][i] = np.datetime64(session_data['timestamp'])
+            cols['files_parsed'][i] = len(session_data['files_parsed'])
+
             # Extract battery information
-            if 'battery_basic' in session_data:
-                battery = session_data['battery_basic']
-                row.update({
-                    'battery_level': battery.get('std_level', None),
-                    'battery_voltage': battery.get('std_voltage', None),
-                    'battery_temperature': battery.get('std_temperature', None),
-                    'charging_status': battery.get('std_status', None),
-                    'ac_powered': battery.get('std_AC powered', None),
-                    'usb_powered': battery.get('std_USB powered', None),
-                    'phone_temp': battery.get('oplus_PhoneTemp', None)
-                })
-            
+            battery = session_data.get('battery_basic')
+            if battery:
+                _fill(cols['battery_level'], i, battery.get('std_level'))
+                _fill(cols['battery_voltage'], i, battery.get('std_voltage'))
+                _fill(cols['battery_temperature'], i, battery.get('std_temperature'))
+                _fill(cols['charging_status'], i, battery.get('std_status'))
+                cols['ac_powered'][i] = battery.get('std_AC powered', None)
+                cols['usb_powered'][i] = battery.get('std_USB powered', None)
+                _fill(cols['phone_temp'], i, battery.get('oplus_PhoneTemp'))
+
             # Extract device information
-            if 'device_info' in session_data:
-                device = session_data['device_info']
-                row.update({
-                    'model': device.get('model', None),
-                    'brand': device.get('brand', None),
-                    'android_version': device.get('android_version', None)
-                })
-            
+            device = session_data.get('device_info')
+            if device:
+                cols['model'][i] = device.get('model', None)
+                cols['brand'][i] = device.get('brand', None)
+                cols['android_version'][i] = device.get('android_version', None)
+
             # Extract thermal information
-            if 'thermal' in session_data:
-                thermal = session_data['thermal']
-                if 'temperatures' in thermal:
-                    temps = thermal['temperatures']
-                    row.update({
-                        'cpu_temp': temps.get('CPU', {}).get('value', None),
-                        'gpu_temp': temps.get('GPU', {}).get('value', None),
-                        'battery_temp_thermal': temps.get('BATTERY', {}).get('value', None),
-                        'skin_temp': temps.get('SKIN', {}).get('value', None)
-                    })
-            
+            thermal = session_data.get('thermal')
+            if thermal and 'temperatures' in thermal:
+                temps = thermal['temperatures']
+                _fill(cols['cpu_temp'], i, temps.get('CPU', {}).get('value'))
+                _fill(cols['gpu_temp'], i, temps.get('GPU', {}).get('value'))
+                _fill(cols['battery_temp_thermal'], i, temps.get('BATTERY', {}).get('value'))
+                _fill(cols['skin_temp'], i, temps.get('SKIN', {}).get('value'))
+
             # Extract process and memory information
-            if 'procstats' in session_data:
-                procstats = session_data['procstats']
-                row.update({
-                    'total_processes': procstats.get('total_processes', None)
-                })
-            
-            if 'memory_info' in session_data:
-                memory = session_data['memory_info']
-                row.update({
-                    'total_ram_gb': memory.get('total_ram_gb', None),
-                    'used_ram_mb': memory.get('used_ram_mb', None),
-                    'ram_usage_percent': memory.get('ram_usage_percent', None)
-                })
-            
-            if 'battery_stats_detailed' in session_data:
-                battery_detailed = session_data['battery_stats_detailed']
-                row.update({
-                    'total_screen_time_ms': battery_detailed.get('total_screen_time_ms', None),
-                    'total_cpu_time_ms': battery_detailed.get('total_cpu_time_ms', None),
-                    'total_wake_lock_ms': battery_detailed.get('total_wake_lock_ms', None)
-                })
-            
-            summary_data.append(row)
-        
-        df = pd.DataFrame(summary_data)
-        df = df.sort_values('timestamp')
-        return df
+            procstats = session_data.get('procstats')
+            if procstats:
+                _fill(cols['total_processes'], i, procstats.get('total_processes'))
+
+            memory = session_data.get('memory_info')
+            if memory:
+                _fill(cols['total_ram_gb'], i, memory.get('total_ram_gb'))
+                _fill(cols['used_ram_mb'], i, memory.get('used_ram_mb'))
+                _fill(cols['ram_usage_percent'], i, memory.get('ram_usage_percent'))
+
+            battery_detailed = session_data.get('battery_stats_detailed')
+            if battery_detailed:
+                _fill(cols['total_screen_time_ms'], i, battery_detailed.get('total_screen_time_ms'))
+                _fill(cols['total_cpu_time_ms'], i, battery_detailed.get('total_cpu_time_ms'))
+                _fill(cols['total_wake_lock_ms'], i, battery_detailed.get('total_wake_lock_ms'))
+
+        # Sort by timestamp with a single argsort and permute every column
+        order = np.argsort(cols['timestamp'], kind='stable')
+        for key in cols:
+            cols[key] = cols[key][order]
+
+        import pandas as pd
+
+        with warnings.catch_warnings():
+            # pandas can warn about dtype inference on the object columns
+            warnings.simplefilter('ignore')
+            summary_df = pd.DataFrame(cols)
+        return _downcast_summary(summary_df)
 
 def analyze_battery_health(summary_df):
     """Analyze battery health and performance"""
     if summary_df.empty:
         print("No data available for analysis.")
         return
+
+    # Buffer the report and emit it with one stdout write at the end
+    out = []
+    out.append("=== BATTERY HEALTH ANALYSIS ===\n")
     
-    print("=== BATTERY HEALTH ANALYSIS ===\n")
-    
-    # Battery level statistics
+    # Battery level statistics, computed on plain NumPy arrays (one column
+    # extraction instead of a pandas dispatch per statistic)
     if 'battery_level' in summary_df.columns:
-        valid_battery = summary_df.dropna(subset=['battery_level'])
-        if not valid_battery.empty:
-            print(f"Battery Level Statistics:")
-            print(f"  Average: {valid_battery['battery_level'].mean():.1f}%")
-            print(f"  Minimum: {valid_battery['battery_level'].min()}%")
-            print(f"  Maximum: {valid_battery['battery_level'].max()}%")
-            print(f"  Standard Deviation: {valid_battery['battery_level'].std():.1f}%")
-            
+        levels = summary_df['battery_level'].to_numpy(dtype=np.float64)
+        level_mask = ~np.isnan(levels)
+        if level_mask.any():
+            valid_levels = levels[level_mask]
+            # ddof=1 on a single sample warns before yielding nan; keep
+            # pandas' silent nan behavior instead
+            level_std = valid_levels.std(ddof=1) if valid_levels.size > 1 else np.nan
+            out.append(f"Battery Level Statistics:")
+            out.append(f"  Average: {valid_levels.mean():.1f}%")
+            out.append(f"  Minimum: {valid_levels.min()}%")
+            out.append(f"  Maximum: {valid_levels.max()}%")
+            out.append(f"  Standard Deviation: {level_std:.1f}%")
+
             # Battery usage patterns
-            if len(valid_battery) > 1:
-                # Calculate time differences and battery drain rates
-                valid_battery_sorted = valid_battery.sort_values('timestamp')
-                time_diffs = valid_battery_sorted['timestamp'].diff().dt.total_seconds() / 3600  # hours
-                battery_diffs = valid_battery_sorted['battery_level'].diff()
-                
-                # Calculate drain rates (negative values indicate discharge)
-                drain_rates = battery_diffs / time_diffs
-                valid_drain_rates = drain_rates.dropna()
-                
-                if not valid_drain_rates.empty:
-                    print(f"\nBattery Drain Analysis:")
-                    print(f"  Average Drain Rate: {valid_drain_rates.mean():.2f}% per hour")
-                    print(f"  Fastest Drain: {valid_drain_rates.min():.2f}% per hour")
-                    print(f"  Slowest Drain: {valid_drain_rates.max():.2f}% per hour")
-                    
+            if valid_levels.size > 1:
+                # Order by timestamp and compute drain rates as fused array ops
+                timestamps = summary_df['timestamp'].to_numpy()[level_mask]
+                order = np.argsort(timestamps, kind='stable')
+                sorted_times = timestamps[order]
+                sorted_levels = valid_levels[order]
+
+                # Drain rates in % per hour (negative values indicate discharge)
+                time_diffs_h = np.diff(sorted_times).astype('timedelta64[s]').astype(np.float64) / 3600.0
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    drain_rates = np.diff(sorted_levels) / time_diffs_h
+                drain_rates = drain_rates[np.isfinite(drain_rates)]
+
+                if drain_rates.size:
+                    out.append(f"\nBattery Drain Analysis:")
+                    out.append(f"  Average Drain Rate: {drain_rates.mean():.2f}% per hour")
+                    out.append(f"  Fastest Drain: {drain_rates.min():.2f}% per hour")
+                    out.append(f"  Slowest Drain: {drain_rates.max():.2f}% per hour")
+
                     # Identify charging vs discharging periods
-                    charging_periods = valid_drain_rates[valid_drain_rates > 0]
-                    discharging_periods = valid_drain_rates[valid_drain_rates < 0]
-                    
-                    if not charging_periods.empty:
-                        print(f"  Average Charging Rate: {charging_periods.mean():.2f}% per hour")
-                    if not discharging_periods.empty:
-                        print(f"  Average Discharging Rate: {discharging_periods.mean():.2f}% per hour")
+                    charging_periods = drain_rates[drain_rates > 0]
+                    discharging_periods = drain_rates[drain_rates < 0]
+
+                    if charging_periods.size:
+                        out.append(f"  Average Charging Rate: {charging_periods.mean():.2f}% per hour")
+                    if discharging_periods.size:
+                        out.append(f"  Average Discharging Rate: {discharging_periods.mean():.2f}% per hour")
     
     # Temperature analysis
-    print(f"\n=== TEMPERATURE ANALYSIS ===\n")
+    out.append(f"\n=== TEMPERATURE ANALYSIS ===\n")
     temp_columns = ['battery_temperature', 'cpu_temp', 'gpu_temp', 'skin_temp']
     available_temps = [col for col in temp_columns if col in summary_df.columns]
-    
-    for temp_col in available_temps:
-        valid_temp = summary_df.dropna(subset=[temp_col])
-        if not valid_temp.empty:
+
+    # Pull all temperature columns into one (N, K) matrix in a single pass
+    if available_temps:
+        temp_matrix = summary_df[available_temps].to_numpy(dtype=np.float64)
+
+    for k, temp_col in enumerate(available_temps):
+        column = temp_matrix[:, k]
+        valid_temp = column[~np.isnan(column)]
+        if valid_temp.size:
+            temp_mean = valid_temp.mean()
+            temp_max = valid_temp.max()
+            temp_std = valid_temp.std(ddof=1) if valid_temp.size > 1 else np.nan
             temp_name = temp_col.replace('_', ' ').title()
-            print(f"{temp_name}:")
-            print(f"  Average: {valid_temp[temp_col].mean():.1f}°C")
-            print(f"  Minimum: {valid_temp[temp_col].min():.1f}°C")
-            print(f"  Maximum: {valid_temp[temp_col].max():.1f}°C")
-            print(f"  Standard Deviation: {valid_temp[temp_col].std():.1f}°C")
-            
+            out.append(f"{temp_name}:")
+            out.append(f"  Average: {temp_mean:.1f}°C")
+            out.append(f"  Minimum: {valid_temp.min():.1f}°C")
+            out.append(f"  Maximum: {temp_max:.1f}°C")
+            out.append(f"  Standard Deviation: {temp_std:.1f}°C")
+
             # Temperature warnings
             if temp_col == 'battery_temperature':
-                if valid_temp[temp_col].max() > 45:
-                    print(f"  ⚠️  WARNING: Maximum temperature exceeds 45°C!")
-                if valid_temp[temp_col].mean() > 40:
-                    print(f"  ⚠️  WARNING: Average temperature is high!")
+                if temp_max > 45:
+                    out.append(f"  ⚠️  WARNING: Maximum temperature exceeds 45°C!")
+                if temp_mean > 40:
+                    out.append(f"  ⚠️  WARNING: Average temperature is high!")
             elif temp_col in ['cpu_temp', 'gpu_temp']:
-                if valid_temp[temp_col].max() > 80:
-                    print(f"  ⚠️  WARNING: Maximum temperature exceeds 80°C!")
-            
-            print()
+                if temp_max > 80:
+                    out.append(f"  ⚠️  WARNING: Maximum temperature exceeds 80°C!")
+
+            out.append('')
     
     # Device information summary
-    print(f"\n=== DEVICE INFORMATION ===\n")
-    if 'model' in summary_df.columns:
-        models = summary_df['model'].dropna().unique()
-        if len(models) > 0:
-            print(f"Device Model: {models[0]}")
-    
-    if 'brand' in summary_df.columns:
-        brands = summary_df['brand'].dropna().unique()
-        if len(brands) > 0:
-            print(f"Brand: {brands[0]}")
+    out.append(f"\n=== DEVICE INFORMATION ===\n")
+    device_fields = (('model', 'Device Model'), ('brand', 'Brand'),
+                     ('android_version', 'Android Version'))
+    for col, label in device_fields:
+        if col in summary_df.columns:
+            # first_valid_index avoids materializing dropna/unique copies
+            first = summary_df[col].first_valid_index()
+            if first is not None:
+                out.append(f"{label}: {summary_df[col].loc[first]}")
     
-    if 'android_version' in summary_df.columns:
-        versions = summary_df['android_version'].dropna().unique()
-        if len(versions) > 0:
-            print(f"Android Version: {versions[0]}")
-    
-    print(f"Total Diagnostic Sessions: {len(summary_df)}")
+    out.append(f"Total Diagnostic Sessions: {len(summary_df)}")
     
     if 'timestamp' in summary_df.columns:
-        time_range = summary_df['timestamp'].max() - summary_df['timestamp'].min()
-        print(f"Data Collection Period: {time_range}")
+        # The summary is sorted by timestamp at construction, so the span is
+        # just the difference of the end rows — after dropping NaT rows from
+        # sessions whose directory name failed to parse (they sort last)
+        valid_ts = summary_df['timestamp'].dropna()
+        if not valid_ts.empty:
+            time_range = valid_ts.iloc[-1] - valid_ts.iloc[0]
+        else:
+            time_range = summary_df['timestamp'].max() - summary_df['timestamp'].min()
+        out.append(f"Data Collection Period: {time_range}")
 
-def analyze_process_performance(parsed_data):
-    """Analyze process performance and resource usage"""
-    print("=== PROCESS PERFORMANCE ANALYSIS ===\n")
+    sys.stdout.write('\n'.join(out) + '\n')
+
+def _process_performance_report(item):
+    """Build one session's process performance report (pool worker)"""
+    session_name, session_data = item
+    out = []
+    out.append(f"Session: {session_name}")
     
-    for session_name, session_data in parsed_data.items():
-        print(f"Session: {session_name}")
+    if 'procstats' in session_data:
+        procstats = session_data['procstats']
+        processes = procstats.get('processes', [])
         
-        if 'procstats' in session_data:
-            procstats = session_data['procstats']
-            processes = procstats.get('processes', [])
-            
-            print(f"  Total Processes: {len(processes)}")
-            
-            # Find top memory consumers
-            if processes:
-                # Sort by total percentage (if available)
-                sorted_processes = sorted(processes, 
-                                       key=lambda x: x.get('stats', {}).get('total_percent', 0), 
-                                       reverse=True)
-                
-                print(f"  Top 5 Most Active Processes:")
-                for i, proc in enumerate(sorted_processes[:5]):
-                    stats = proc.get('stats', {})
-                    print(f"    {i+1}. {proc['package_name']}")
-                    print(f"       Total: {stats.get('total_percent', 'N/A')}%")
-                    print(f"       Persistent: {stats.get('persistent_percent', 'N/A')}%")
-                    print(f"       Service: {stats.get('service_percent', 'N/A')}%")
-                    print(f"       Bound FG: {stats.get('bound_foreground_percent', 'N/A')}%")
+        out.append(f"  Total Processes: {len(processes)}")
         
-        if 'memory_info' in session_data:
-            memory = session_data['memory_info']
-            print(f"  Memory Usage:")
-            print(f"    Total RAM: {memory.get('total_ram_gb', 'N/A'):.2f} GB")
-            print(f"    Used RAM: {memory.get('used_ram_mb', 'N/A'):.1f} MB")
-            print(f"    RAM Usage: {memory.get('ram_usage_percent', 'N/A'):.1f}%")
-            
-            if 'top_memory_apps' in memory:
-                print(f"  Top 5 Memory Consumers:")
-                for i, app in enumerate(memory['top_memory_apps'][:5]):
-                    print(f"    {i+1}. {app['app_name']}: {app['memory_mb']:.1f} MB")
+        # Find top memory consumers
+        if processes:
+            # One linear pass extracts (index, total_percent) tuples; the
+            # heap-based top-5 then compares via a C-level itemgetter key
+            # with no DataFrame built per session
+            flat = [(i, p.get('stats', {}).get('total_percent', 0))
+                    for i, p in enumerate(processes)]
+
+            out.append(f"  Top 5 Most Active Processes:")
+            for i, (proc_idx, _) in enumerate(heapq.nlargest(5, flat, key=itemgetter(1))):
+                proc = processes[proc_idx]
+                stats = proc.get('stats', {})
+                out.append(f"    {i+1}. {proc['package_name']}")
+                out.append(f"       Total: {stats.get('total_percent', 'N/A')}%")
+                out.append(f"       Persistent: {stats.get('persistent_percent', 'N/A')}%")
+                out.append(f"       Service: {stats.get('service_percent', 'N/A')}%")
+                out.append(f"       Bound FG: {stats.get('bound_foreground_percent', 'N/A')}%")
+    
+    if 'memory_info' in session_data:
+        memory = session_data['memory_info']
+        out.append(f"  Memory Usage:")
+        out.append(f"    Total RAM: {memory.get('total_ram_gb', 'N/A'):.2f} GB")
+        out.append(f"    Used RAM: {memory.get('used_ram_mb', 'N/A'):.1f} MB")
+        out.append(f"    RAM Usage: {memory.get('ram_usage_percent', 'N/A'):.1f}%")
         
-        print()
+        if 'top_memory_apps' in memory:
+            out.append(f"  Top 5 Memory Consumers:")
+            for i, app in enumerate(memory['top_memory_apps'][:5]):
+                out.append(f"    {i+1}. {app['app_name']}: {app['memory_mb']:.1f} MB")
+    
+    out.append('')
+
+    return '\n'.join(out)
+
+
+def analyze_process_performance(parsed_data):
+    """Analyze process performance and resource usage"""
+    # Sessions are independent, so their reports are built in parallel and
+    # emitted in input order with one stdout write
+    out = ["=== PROCESS PERFORMANCE ANALYSIS ===\n"]
+    with ProcessPoolExecutor() as executor:
+        out.extend(executor.map(_process_performance_report,
+                                parsed_data.items(), chunksize=4))
+    sys.stdout.write('\n'.join(out) + '\n')
+
+def build_app_battery_table(parsed_data):
+    """Flatten app battery entries from all sessions into one Arrow table.
+
+    Columns are session/package_name/wake_lock_ms/cpu_time_ms/screen_time_ms
+    in contiguous typed buffers, so downstream ranking touches flat arrays
+    instead of walking four levels of dicts per value. Returns None when
+    pyarrow is not installed or no session has detailed battery stats."""
+    if _pa is None:
+        return None
+
+    sessions, pkgs, wake, cpu, screen = [], [], [], [], []
+    for session_name, session_data in parsed_data.items():
+        detailed = session_data.get('battery_stats_detailed')
+        if not detailed:
+            continue
+        for app in detailed.get('app_battery', ()):
+            stats = app.get('stats', {})
+            sessions.append(session_name)
+            pkgs.append(app.get('package_name', ''))
+            wake.append(stats.get('wake_lock_ms', 0))
+            cpu.append(stats.get('cpu_time_ms', 0))
+            screen.append(stats.get('screen_time_ms', 0))
+
+    if not sessions:
+        return None
+    return _pa.table({
+        'session': _pa.array(sessions, type=_pa.dictionary(_pa.int32(), _pa.string())),
+        'package_name': pkgs,
+        'wake_lock_ms': _pa.array(wake, type=_pa.int64()),
+        'cpu_time_ms': _pa.array(cpu, type=_pa.int64()),
+        'screen_time_ms': _pa.array(screen, type=_pa.int64()),
+    })
+
 
 def analyze_battery_drain_sources(parsed_data):
     """Analyze battery drain sources and patterns"""
-    print("=== BATTERY DRAIN SOURCE ANALYSIS ===\n")
-    
+    import pandas as pd
+
+    # Buffer the report and emit it with one stdout write at the end
+    out = []
+    out.append("=== BATTERY DRAIN SOURCE ANALYSIS ===\n")
+
+    # Flatten every session's app entries into one long frame up front; each
+    # metric's per-session top-5 is then a single C-level sort + groupby head
+    # instead of re-entering Python for every session. With pyarrow the
+    # flattening lands directly in typed columnar buffers.
+    table = build_app_battery_table(parsed_data)
+    if table is not None:
+        long_df = table.to_pandas()
+    else:
+        frames = []
+        for session_name, session_data in parsed_data.items():
+            detailed = session_data.get('battery_stats_detailed')
+            if detailed and detailed.get('app_battery'):
+                frames.append(pd.json_normalize(detailed['app_battery'])
+                              .assign(session=session_name))
+        long_df = pd.concat(frames, ignore_index=True) if frames else None
+        if long_df is not None:
+            long_df.columns = [c.removeprefix('stats.') for c in long_df.columns]
+
+    metrics = (
+        ('wake_lock_ms', 'Top 5 Wake Lock Offenders', 'seconds', 1000),
+        ('cpu_time_ms', 'Top 5 CPU Consumers', 'seconds', 1000),
+        ('screen_time_ms', 'Top 5 Screen Time Consumers', 'seconds', 1000),
+    )
+
+    tops = {}
+    if table is not None:
+        # Arrow's select_k kernel partial-sorts each session's typed buffers
+        # in C++, replacing the pandas sort + groupby path entirely
+        import pyarrow.compute as pc
+
+        session_names = pc.cast(table['session'], _pa.string())
+        for session_name in pc.unique(session_names).to_pylist():
+            sub = table.filter(pc.equal(session_names, session_name))
+            for col, _, _, _ in metrics:
+                top = sub.take(pc.select_k_unstable(
+                    sub, k=5, sort_keys=[(col, 'descending')]))
+                tops.setdefault(col, {})[session_name] = (
+                    top['package_name'].to_pylist(), top[col].to_numpy())
+    elif long_df is not None:
+        for col, _, _, _ in metrics:
+            if col not in long_df.columns:
+                long_df[col] = 0
+            long_df[col] = long_df[col].fillna(0)
+        for col, _, _, _ in metrics:
+            top5 = (long_df.sort_values(col, ascending=False, kind='stable')
+                           .groupby('session', sort=False).head(5))
+            tops[col] = {name: (group['package_name'].tolist(), group[col].to_numpy())
+                         for name, group in top5.groupby('session', sort=False)}
+
     for session_name, session_data in parsed_data.items():
-        print(f"Session: {session_name}")
-        
-        if 'battery_stats_detailed' in session_data:
-            battery_detailed = session_data['battery_stats_detailed']
-            app_battery = battery_detailed.get('app_battery', [])
-            
-            if app_battery:
-                # Sort by wake lock time (biggest battery drainers)
-                wake_lock_apps = sorted(app_battery, 
-                                      key=lambda x: x.get('stats', {}).get('wake_lock_ms', 0), 
-                                      reverse=True)
-                
-                print(f"  Top 5 Wake Lock Offenders:")
-                for i, app in enumerate(wake_lock_apps[:5]):
-                    stats = app.get('stats', {})
-                    wake_time = stats.get('wake_lock_ms', 0)
-                    if wake_time > 0:
-                        print(f"    {i+1}. {app['package_name']}: {wake_time/1000:.1f} seconds")
-                
-                # Sort by CPU time
-                cpu_apps = sorted(app_battery, 
-                                key=lambda x: x.get('stats', {}).get('cpu_time_ms', 0), 
-                                reverse=True)
-                
-                print(f"  Top 5 CPU Consumers:")
-                for i, app in enumerate(cpu_apps[:5]):
-                    stats = app.get('stats', {})
-                    cpu_time = stats.get('cpu_time_ms', 0)
-                    if cpu_time > 0:
-                        print(f"    {i+1}. {app['package_name']}: {cpu_time/1000:.1f} seconds")
-                
-                # Sort by screen time
-                screen_apps = sorted(app_battery, 
-                                   key=lambda x: x.get('stats', {}).get('screen_time_ms', 0), 
-                                   reverse=True)
-                
-                print(f"  Top 5 Screen Time Consumers:")
-                for i, app in enumerate(screen_apps[:5]):
-                    stats = app.get('stats', {})
-                    screen_time = stats.get('screen_time_ms', 0)
-                    if screen_time > 0:
-                        print(f"    {i+1}. {app['package_name']}: {screen_time/1000:.1f} seconds")
-        
-        print()
+        out.append(f"Session: {session_name}")
+
+        if tops and session_name in tops[metrics[0][0]]:
+            for col, heading, unit, divisor in metrics:
+                out.append(f"  {heading}:")
+                entry = tops[col].get(session_name)
+                if entry is None:
+                    continue
+                pkg_names, values = entry
+                for i, (pkg, value) in enumerate(zip(pkg_names, values)):
+                    if value > 0:
+                        out.append(f"    {i+1}. {pkg}: {value/divisor:.1f} {unit}")
+
+        out.append('')
+
+    sys.stdout.write('\n'.join(out) + '\n')
+
+def _plot_timeline(ax, t, summary_df, col, title, ylabel, empty_msg, scale=1.0, color=None):
+    """Plot one summary column against the shared timestamp array.
+
+    Reuses the column's notna mask to slice plain numpy vectors instead of
+    allocating a dropna DataFrame copy per axis."""
+    mask = None
+    if col in summary_df.columns:
+        mask = summary_df[col].notna().to_numpy()
+    if mask is None or not mask.any():
+        ax.text(0.5, 0.5, empty_msg, ha='center', va='center', transform=ax.transAxes)
+        return
+    y = summary_df[col].to_numpy(dtype=np.float64)[mask]
+    if scale != 1.0:
+        y = y / scale
+    if _ds is not None and mask.sum() > _DATASHADER_THRESHOLD:
+        _shade_timeline(ax, t[mask], y, title, ylabel)
+        return
+    kwargs = {'linewidth': 2, 'markersize': 8}
+    if color is not None:
+        kwargs['color'] = color
+    ax.plot(t[mask], y, 'o-', **kwargs)
+    ax.set_title(title, fontsize=14, fontweight='bold')
+    ax.set_ylabel(ylabel)
+    ax.set_xlabel('Time')
+    ax.grid(True, alpha=0.3)
+    ax.tick_params(axis='x', rotation=45)
+
+
+def _shade_timeline(ax, times, y, title, ylabel):
+    """Rasterize a large timeline with datashader and embed it in the axis.
+
+    float32 halves the aggregation bandwidth and the canvas stays a fixed
+    800x300 image no matter how many sessions are plotted."""
+    import pandas as pd
+
+    xs = times.astype('int64').astype(np.float64)
+    df = pd.DataFrame({'t': xs, 'y': y.astype(np.float32)})
+    cvs = _ds.Canvas(plot_width=800, plot_height=300)
+    img = _ds_tf.shade(cvs.line(df, 't', 'y'))
+    ax.imshow(img.to_pil(), aspect='auto',
+              extent=[xs.min(), xs.max(), float(y.min()), float(y.max())])
+    ax.set_title(title, fontsize=14, fontweight='bold')
+    ax.set_ylabel(ylabel)
+    ax.set_xlabel('Time')
+
+
+_PROCESS_TYPE_NAMES = ('Persistent', 'Service', 'Bound FG', 'Other')
 
-def create_enhanced_visualizations(summary_df, parsed_data):
-    """Create enhanced visualizations including process analysis"""
+# Below this many processes, Counter over the plain dicts beats flattening
+# them into arrays; above it the vectorized/JIT classifiers win
+_COUNTER_THRESHOLD = 512
+
+
+def _process_type(proc):
+    """Classify one process dict by its dominant stat"""
+    stats = proc.get('stats', {})
+    if stats.get('persistent_percent', 0) > 50:
+        return 'Persistent'
+    if stats.get('service_percent', 0) > 50:
+        return 'Service'
+    if stats.get('bound_foreground_percent', 0) > 50:
+        return 'Bound FG'
+    return 'Other'
+
+
+def _process_type_counts(processes):
+    """Return (labels, sizes) of process-type counts for the pie chart"""
+    if len(processes) < _COUNTER_THRESHOLD:
+        counts = Counter(_process_type(p) for p in processes)
+        labels = [name for name in _PROCESS_TYPE_NAMES if counts[name]]
+        return labels, [counts[name] for name in labels]
+
+    import pandas as pd
+
+    pf = pd.json_normalize(processes)
+    stat_cols = ('stats.persistent_percent', 'stats.service_percent',
+                 'stats.bound_foreground_percent')
+    for c in stat_cols:
+        if c not in pf.columns:
+            pf[c] = 0.0
+    arrs = [pf[c].fillna(0).to_numpy(dtype=np.float32) for c in stat_cols]
+
+    if _classify_process_types is not None:
+        # JIT-compiled branchy loop over the three stat vectors; bincount
+        # turns the int8 categories into pie counts
+        cats = np.bincount(_classify_process_types(*arrs), minlength=4)
+        labels = [name for name, c in zip(_PROCESS_TYPE_NAMES, cats) if c]
+        return labels, [int(c) for c in cats if c]
+
+    conditions = [a > 50 for a in arrs]
+    types = np.select(conditions, _PROCESS_TYPE_NAMES[:3], default='Other')
+    counts = pd.Series(types).value_counts()
+    return counts.index.tolist(), counts.values.tolist()
+
+
+_ENHANCED_PLOT_COLS = ('ram_usage_percent', 'total_processes',
+                       'total_wake_lock_ms', 'total_cpu_time_ms',
+                       'total_screen_time_ms')
+_BASIC_PLOT_COLS = ('battery_level', 'battery_temperature', 'cpu_temp',
+                    'gpu_temp', 'skin_temp', 'charging_status',
+                    'ac_powered', 'usb_powered')
+
+
+def _has_plottable_data(summary_df, cols):
+    """True when at least one of the given columns holds a value"""
+    return any(c in summary_df.columns and summary_df[c].notna().any()
+               for c in cols)
+
+
+def create_enhanced_visualizations(summary_df, parsed_data, axes=None):
+    """Create enhanced visualizations including process analysis.
+
+    When axes (a 2x3 grid) is given, the plots are drawn onto it and the
+    caller owns the figure; otherwise a figure is created, shown and
+    closed here."""
     if summary_df.empty:
         print("No data available for visualization.")
         return
+    if not _has_plottable_data(summary_df, _ENHANCED_PLOT_COLS) and not any(
+            'procstats' in sd for sd in parsed_data.values()):
+        # Nothing would be drawn; skip the whole figure setup
+        print("No data available for visualization.")
+        return
     
     # Create figure with subplots for enhanced analysis
-    fig, axes = plt.subplots(2, 3, figsize=(20, 12))
-    fig.suptitle('Enhanced Phone Diagnostic Analysis', fontsize=16, fontweight='bold')
+    plt = _configure_plotting()
+    own_figure = axes is None
+    if own_figure:
+        fig, axes = plt.subplots(2, 3, figsize=(20, 12), constrained_layout=True)
+        fig.suptitle('Enhanced Phone Diagnostic Analysis', fontsize=16, fontweight='bold')
     
+    # Shared time axis; each subplot slices it with its column's notna mask
+    t = summary_df['timestamp'].to_numpy()
+
     # 1. Memory Usage Over Time
-    ax1 = axes[0, 0]
-    if 'ram_usage_percent' in summary_df.columns:
-        valid_memory = summary_df.dropna(subset=['ram_usage_percent'])
-        if not valid_memory.empty:
-            ax1.plot(valid_memory['timestamp'], valid_memory['ram_usage_percent'], 'o-', linewidth=2, markersize=8)
-            ax1.set_title('RAM Usage Over Time', fontsize=14, fontweight='bold')
-            ax1.set_ylabel('RAM Usage (%)')
-            ax1.set_xlabel('Time')
-            ax1.grid(True, alpha=0.3)
-            ax1.tick_params(axis='x', rotation=45)
-        else:
-            ax1.text(0.5, 0.5, 'No memory data available', ha='center', va='center', transform=ax1.transAxes)
-    else:
-        ax1.text(0.5, 0.5, 'No memory data available', ha='center', va='center', transform=ax1.transAxes)
-    
+    _plot_timeline(axes[0, 0], t, summary_df, 'ram_usage_percent',
+                   'RAM Usage Over Time', 'RAM Usage (%)',
+                   'No memory data available')
+
     # 2. Process Count Over Time
-    ax2 = axes[0, 1]
-    if 'total_processes' in summary_df.columns:
-        valid_processes = summary_df.dropna(subset=['total_processes'])
-        if not valid_processes.empty:
-            ax2.plot(valid_processes['timestamp'], valid_processes['total_processes'], 'o-', linewidth=2, markersize=8)
-            ax2.set_title('Total Processes Over Time', fontsize=14, fontweight='bold')
-            ax2.set_ylabel('Number of Processes')
-            ax2.set_xlabel('Time')
-            ax2.grid(True, alpha=0.3)
-            ax2.tick_params(axis='x', rotation=45)
-        else:
-            ax2.text(0.5, 0.5, 'No process data available', ha='center', va='center', transform=ax1.transAxes)
-    else:
-        ax2.text(0.5, 0.5, 'No process data available', ha='center', va='center', transform=ax1.transAxes)
-    
-    # 3. Wake Lock Time Over Time
-    ax3 = axes[0, 2]
-    if 'total_wake_lock_ms' in summary_df.columns:
-        valid_wake = summary_df.dropna(subset=['total_wake_lock_ms'])
-        if not valid_wake.empty:
-            # Convert to seconds for readability
-            wake_seconds = valid_wake['total_wake_lock_ms'] / 1000
-            ax3.plot(valid_wake['timestamp'], wake_seconds, 'o-', linewidth=2, markersize=8, color='red')
-            ax3.set_title('Total Wake Lock Time Over Time', fontsize=14, fontweight='bold')
-            ax3.set_ylabel('Wake Lock Time (seconds)')
-            ax3.set_xlabel('Time')
-            ax3.grid(True, alpha=0.3)
-            ax3.tick_params(axis='x', rotation=45)
-        else:
-            ax3.text(0.5, 0.5, 'No wake lock data available', ha='center', va='center', transform=ax1.transAxes)
-    else:
-        ax3.text(0.5, 0.5, 'No wake lock data available', ha='center', va='center', transform=ax1.transAxes)
-    
-    # 4. CPU Time Over Time
-    ax4 = axes[1, 0]
-    if 'total_cpu_time_ms' in summary_df.columns:
-        valid_cpu = summary_df.dropna(subset=['total_cpu_time_ms'])
-        if not valid_cpu.empty:
-            # Convert to seconds for readability
-            cpu_seconds = valid_cpu['total_cpu_time_ms'] / 1000
-            ax4.plot(valid_cpu['timestamp'], cpu_seconds, 'o-', linewidth=2, markersize=8, color='orange')
-            ax4.set_title('Total CPU Time Over Time', fontsize=14, fontweight='bold')
-            ax4.set_ylabel('CPU Time (seconds)')
-            ax4.set_xlabel('Time')
-            ax4.grid(True, alpha=0.3)
-            ax4.tick_params(axis='x', rotation=45)
-        else:
-            ax4.text(0.5, 0.5, 'No CPU data available', ha='center', va='center', transform=ax1.transAxes)
-    else:
-        ax4.text(0.5, 0.5, 'No CPU data available', ha='center', va='center', transform=ax1.transAxes)
-    
-    # 5. Screen Time Over Time
-    ax5 = axes[1, 1]
-    if 'total_screen_time_ms' in summary_df.columns:
-        valid_screen = summary_df.dropna(subset=['total_screen_time_ms'])
-        if not valid_screen.empty:
-            # Convert to minutes for readability
-            screen_minutes = valid_screen['total_screen_time_ms'] / 60000
-            ax5.plot(valid_screen['timestamp'], screen_minutes, 'o-', linewidth=2, markersize=8, color='green')
-            ax5.set_title('Total Screen Time Over Time', fontsize=14, fontweight='bold')
-            ax5.set_ylabel('Screen Time (minutes)')
-            ax5.set_xlabel('Time')
-            ax5.grid(True, alpha=0.3)
-            ax5.tick_params(axis='x', rotation=45)
-        else:
-            ax5.text(0.5, 0.5, 'No screen time data available', ha='center', va='center', transform=ax1.transAxes)
-    else:
-        ax5.text(0.5, 0.5, 'No screen time data available', ha='center', va='center', transform=ax1.transAxes)
+    _plot_timeline(axes[0, 1], t, summary_df, 'total_processes',
+                   'Total Processes Over Time', 'Number of Processes',
+                   'No process data available')
+
+    # 3. Wake Lock Time Over Time (seconds for readability)
+    _plot_timeline(axes[0, 2], t, summary_df, 'total_wake_lock_ms',
+                   'Total Wake Lock Time Over Time', 'Wake Lock Time (seconds)',
+                   'No wake lock data available', scale=1000, color='red')
+
+    # 4. CPU Time Over Time (seconds for readability)
+    _plot_timeline(axes[1, 0], t, summary_df, 'total_cpu_time_ms',
+                   'Total CPU Time Over Time', 'CPU Time (seconds)',
+                   'No CPU data available', scale=1000, color='orange')
+
+    # 5. Screen Time Over Time (minutes for readability)
+    _plot_timeline(axes[1, 1], t, summary_df, 'total_screen_time_ms',
+                   'Total Screen Time Over Time', 'Screen Time (minutes)',
+                   'No screen time data available', scale=60000, color='green')
     
     # 6. Process Distribution (if available)
     ax6 = axes[1, 2]
@@ -901,26 +1404,9 @@ def create_enhanced_visualizations(summary_df, parsed_data):
         if latest_session and 'procstats' in latest_session:
             processes = latest_session['procstats']['processes']
             if processes:
-                # Count process types
-                process_types = {}
-                for proc in processes:
-                    stats = proc.get('stats', {})
-                    if stats.get('persistent_percent', 0) > 50:
-                        process_types['Persistent'] = process_types.get('Persistent', 0) + 1
-                    elif stats.get('service_percent', 0) > 50:
-                        process_types['Service'] = process_types.get('Service', 0) + 1
-                    elif stats.get('bound_foreground_percent', 0) > 50:
-                        process_types['Bound FG'] = process_types.get('Bound FG', 0) + 1
-                    else:
-                        process_types['Other'] = process_types.get('Other', 0) + 1
-                
-                if process_types:
-                    labels = list(process_types.keys())
-                    sizes = list(process_types.values())
-                    ax6.pie(sizes, labels=labels, autopct='%1.1f%%', startangle=90)
-                    ax6.set_title('Process Type Distribution', fontsize=14, fontweight='bold')
-                else:
-                    ax6.text(0.5, 0.5, 'No process type data available', ha='center', va='center', transform=ax6.transAxes)
+                labels, sizes = _process_type_counts(processes)
+                ax6.pie(sizes, labels=labels, autopct='%1.1f%%', startangle=90)
+                ax6.set_title('Process Type Distribution', fontsize=14, fontweight='bold')
             else:
                 ax6.text(0.5, 0.5, 'No process data available', ha='center', va='center', transform=ax6.transAxes)
         else:
@@ -928,35 +1414,39 @@ def create_enhanced_visualizations(summary_df, parsed_data):
     else:
         ax6.text(0.5, 0.5, 'No process data available', ha='center', va='center', transform=ax6.transAxes)
     
-    plt.tight_layout()
-    plt.show()
+    if own_figure:
+        plt.show()
+        plt.close(fig)
+
+def create_visualizations(summary_df, axes=None):
+    """Create comprehensive visualizations of the diagnostic data.
 
-def create_visualizations(summary_df):
-    """Create comprehensive visualizations of the diagnostic data"""
+    When axes (at least a 2x2 grid) is given, the plots are drawn onto it
+    and the caller owns the figure; otherwise a figure is created, shown
+    and closed here."""
     if summary_df.empty:
         print("No data available for visualization.")
         return
+    if not _has_plottable_data(summary_df, _BASIC_PLOT_COLS):
+        # Every subplot would just say "no data"; skip the figure entirely
+        print("No data available for visualization.")
+        return
     
     # Create figure with subplots
-    fig, axes = plt.subplots(2, 2, figsize=(16, 12))
-    fig.suptitle('Phone Diagnostic Data Analysis', fontsize=16, fontweight='bold')
+    plt = _configure_plotting()
+    own_figure = axes is None
+    if own_figure:
+        fig, axes = plt.subplots(2, 2, figsize=(16, 12), constrained_layout=True)
+        fig.suptitle('Phone Diagnostic Data Analysis', fontsize=16, fontweight='bold')
     
+    # Shared time axis; each subplot slices it with its column's notna mask
+    t = summary_df['timestamp'].to_numpy()
+
     # 1. Battery Level Trends Over Time
-    ax1 = axes[0, 0]
-    if 'battery_level' in summary_df.columns:
-        valid_battery = summary_df.dropna(subset=['battery_level'])
-        if not valid_battery.empty:
-            ax1.plot(valid_battery['timestamp'], valid_battery['battery_level'], 'o-', linewidth=2, markersize=8)
-            ax1.set_title('Battery Level Over Time', fontsize=14, fontweight='bold')
-            ax1.set_ylabel('Battery Level (%)')
-            ax1.set_xlabel('Time')
-            ax1.grid(True, alpha=0.3)
-            ax1.tick_params(axis='x', rotation=45)
-        else:
-            ax1.text(0.5, 0.5, 'No battery level data available', ha='center', va='center', transform=ax1.transAxes)
-    else:
-        ax1.text(0.5, 0.5, 'No battery level data available', ha='center', va='center', transform=ax1.transAxes)
-    
+    _plot_timeline(axes[0, 0], t, summary_df, 'battery_level',
+                   'Battery Level Over Time', 'Battery Level (%)',
+                   'No battery level data available')
+
     # 2. Temperature Trends
     ax2 = axes[0, 1]
     temp_columns = ['battery_temperature', 'cpu_temp', 'gpu_temp', 'skin_temp']
@@ -964,10 +1454,11 @@ def create_visualizations(summary_df):
     
     if available_temps:
         for temp_col in available_temps:
-            valid_temp = summary_df.dropna(subset=[temp_col])
-            if not valid_temp.empty:
-                ax2.plot(valid_temp['timestamp'], valid_temp[temp_col], 'o-', linewidth=2, markersize=6, 
-                        label=temp_col.replace('_', ' ').title())
+            mask = summary_df[temp_col].notna().to_numpy()
+            if mask.any():
+                ax2.plot(t[mask], summary_df[temp_col].to_numpy(dtype=np.float64)[mask],
+                         'o-', linewidth=2, markersize=6,
+                         label=temp_col.replace('_', ' ').title())
         
         ax2.set_title('Temperature Trends Over Time', fontsize=14, fontweight='bold')
         ax2.set_ylabel('Temperature (°C)')
@@ -980,25 +1471,22 @@ def create_visualizations(summary_df):
     
     # 3. Charging Status Analysis
     ax3 = axes[1, 0]
-    if 'charging_status' in summary_df.columns:
-        valid_charging = summary_df.dropna(subset=['charging_status'])
-        if not valid_charging.empty:
-            charging_counts = valid_charging['charging_status'].value_counts()
-            
-            # Map status codes to readable names
-            status_names = {
-                1: 'Unknown',
-                2: 'Charging',
-                3: 'Discharging',
-                4: 'Not Charging',
-                5: 'Full'
-            }
-            
-            labels = [status_names.get(status, f'Status {status}') for status in charging_counts.index]
-            ax3.pie(charging_counts.values, labels=labels, autopct='%1.1f%%', startangle=90)
-            ax3.set_title('Charging Status Distribution', fontsize=14, fontweight='bold')
-        else:
-            ax3.text(0.5, 0.5, 'No charging status data available', ha='center', va='center', transform=ax3.transAxes)
+    if 'charging_status' in summary_df.columns and summary_df['charging_status'].notna().any():
+        # value_counts skips NaN, so no dropna copy is needed
+        charging_counts = summary_df['charging_status'].value_counts()
+
+        # Map status codes to readable names
+        status_names = {
+            1: 'Unknown',
+            2: 'Charging',
+            3: 'Discharging',
+            4: 'Not Charging',
+            5: 'Full'
+        }
+
+        labels = [status_names.get(status, f'Status {status}') for status in charging_counts.index]
+        ax3.pie(charging_counts.values, labels=labels, autopct='%1.1f%%', startangle=90)
+        ax3.set_title('Charging Status Distribution', fontsize=14, fontweight='bold')
     else:
         ax3.text(0.5, 0.5, 'No charging status data available', ha='center', va='center', transform=ax3.transAxes)
     
@@ -1012,10 +1500,11 @@ def create_visualizations(summary_df):
         power_labels = []
         
         for col in available_power:
-            valid_power = summary_df.dropna(subset=[col])
-            if not valid_power.empty:
-                true_count = valid_power[col].sum()
-                false_count = len(valid_power) - true_count
+            mask = summary_df[col].notna().to_numpy()
+            if mask.any():
+                values = summary_df[col].to_numpy()[mask]
+                true_count = int(np.count_nonzero(values))
+                false_count = int(mask.sum()) - true_count
                 power_data.extend([true_count, false_count])
                 power_labels.extend([f'{col.replace("_", " ").title()} (True)', f'{col.replace("_", " ").title()} (False)'])
         
@@ -1030,8 +1519,54 @@ def create_visualizations(summary_df):
     else:
         ax4.text(0.5, 0.5, 'No power source data available', ha='center', va='center', transform=ax4.transAxes)
     
-    plt.tight_layout()
-    plt.show()
+    if own_figure:
+        plt.show()
+        plt.close(fig)
+
+def _downcast_summary(summary_df):
+    """Shrink numeric summary columns to the smallest dtype that holds them.
+
+    The column arrays are already float32 where precision allows; this pass
+    additionally packs the integer-valued columns (counts and ms totals)
+    when they carry no NaN, halving memory and plot copy bandwidth."""
+    import pandas as pd
+
+    for col in ('files_parsed', 'total_processes', 'total_screen_time_ms',
+                'total_cpu_time_ms', 'total_wake_lock_ms'):
+        if col in summary_df.columns:
+            summary_df[col] = pd.to_numeric(summary_df[col], downcast='integer')
+    return summary_df
+
+
+def load_exported_json(json_path):
+    """Load a detailed JSON export produced by export_data.
+
+    Exports over 50 MB are streamed with ijson over a memory-mapped file
+    when available, materializing one session at a time instead of the
+    whole object tree; smaller files (or installs without ijson) go
+    through a single in-memory decode."""
+    json_path = Path(json_path)
+    if _ijson is not None and json_path.stat().st_size > _STREAM_JSON_THRESHOLD:
+        data = {}
+        with open(json_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for session_name, session_data in _ijson.kvitems(mm, ''):
+                    data[session_name] = session_data
+        return data
+
+    with open(json_path, 'rb') as f:
+        raw = f.read()
+    if _orjson is not None:
+        return _orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_default(obj):
+    """Serialize types the JSON encoders don't handle natively"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return str(obj)
+
 
 def export_data(summary_df, parsed_data):
     """Export data for further analysis"""
@@ -1039,25 +1574,48 @@ def export_data(summary_df, parsed_data):
         print("No data to export.")
         return
     
-    # Export to CSV
-    csv_filename = f"phone_diagnostics_summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-    summary_df.to_csv(csv_filename, index=False)
-    print(f"Summary data exported to: {csv_filename}")
-    
-    # Export detailed parsed data to JSON
-    json_filename = f"phone_diagnostics_detailed_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-    
-    # Convert datetime objects to strings for JSON serialization
-    export_data = {}
-    for session_name, session_data in parsed_data.items():
-        export_data[session_name] = session_data.copy()
-        if export_data[session_name]['timestamp']:
-            export_data[session_name]['timestamp'] = export_data[session_name]['timestamp'].isoformat()
-    
-    with open(json_filename, 'w') as f:
-        json.dump(export_data, f, indent=2)
-    
-    print(f"Detailed data exported to: {json_filename}")
+    stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+
+    # Export the summary table: Parquet when pyarrow is installed (columnar,
+    # compressed, dtypes preserved), CSV otherwise
+    if _pa is not None:
+        summary_filename = f"phone_diagnostics_summary_{stamp}.parquet"
+        summary_df.to_parquet(summary_filename, engine='pyarrow', compression='zstd')
+    else:
+        summary_filename = f"phone_diagnostics_summary_{stamp}.csv"
+        summary_df.to_csv(summary_filename, index=False)
+    print(f"Summary data exported to: {summary_filename}")
+
+    # Export detailed parsed data: Feather with inferred struct columns when
+    # Arrow can represent the nested session payloads, JSON otherwise
+    detailed_filename = None
+    if _pa is not None:
+        try:
+            table = _pa.table({
+                'session': list(parsed_data.keys()),
+                'data': list(parsed_data.values())
+            })
+            detailed_filename = f"phone_diagnostics_detailed_{stamp}.feather"
+            _pa_feather.write_feather(table, detailed_filename, compression='zstd')
+        except (_pa.ArrowInvalid, _pa.ArrowNotImplementedError, _pa.ArrowTypeError, TypeError):
+            # Ragged session payloads that Arrow cannot unify fall back to JSON
+            detailed_filename = None
+
+    if detailed_filename is None:
+        detailed_filename = f"phone_diagnostics_detailed_{stamp}.json"
+
+        # Datetimes are handled by the encoder's default hook, so the session
+        # dicts are serialized in place with no per-session copies
+        if _orjson is not None:
+            with open(detailed_filename, 'wb') as f:
+                f.write(_orjson.dumps(
+                    parsed_data, default=_json_default,
+                    option=_orjson.OPT_INDENT_2 | _orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(detailed_filename, 'w') as f:
+                json.dump(parsed_data, f, indent=2, default=_json_default)
+
+    print(f"Detailed data exported to: {detailed_filename}")
     
     # Display summary statistics
     print(f"\nData Export Summary:")
@@ -1085,9 +1643,13 @@ def run_complete_analysis():
     print("\n2. Parsing diagnostic data...")
     parsed_data = parser.parse_all_sessions()
     
-    # Create summary DataFrame
+    # Create summary DataFrame (reusing the sidecar cache when no session
+    # file changed since the last run)
     print("\n3. Creating summary data...")
-    summary_df = parser.get_summary_dataframe()
+    summary_df = parser.load_cached_summary()
+    if summary_df is None:
+        summary_df = parser.get_summary_dataframe()
+        parser.save_cached_summary(summary_df)
     
     # Display summary
     print("\n4. Summary of all diagnostic sessions:")
@@ -1105,16 +1667,21 @@ def run_complete_analysis():
     print("\n7. Battery drain source analysis:")
     analyze_battery_drain_sources(parsed_data)
     
-    # Create basic visualizations
-    print("\n8. Creating basic visualizations...")
-    create_visualizations(summary_df)
-    
-    # Create enhanced visualizations
-    print("\n9. Creating enhanced process analysis visualizations...")
-    create_enhanced_visualizations(summary_df, parsed_data)
+    # Create visualizations; both sets share one figure so the renderer and
+    # font-cache setup is paid once
+    print("\n8. Creating visualizations...")
+    plt = _configure_plotting()
+    fig, ax_grid = plt.subplots(4, 3, figsize=(20, 24), constrained_layout=True)
+    fig.suptitle('Phone Diagnostic Analysis', fontsize=16, fontweight='bold')
+    create_visualizations(summary_df, axes=ax_grid[:2])
+    for spare in (ax_grid[0, 2], ax_grid[1, 2]):
+        spare.axis('off')
+    create_enhanced_visualizations(summary_df, parsed_data, axes=ax_grid[2:])
+    plt.show()
+    plt.close(fig)
     
     # Export data
-    print("\n10. Exporting data...")
+    print("\n9. Exporting data...")
     export_data(summary_df, parsed_data)
     
     print("\n=== ANALYSIS COMPLETE ===")